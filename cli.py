@@ -13,6 +13,11 @@ import argparse
 import sys
 from pathlib import Path
 
+import orjson
+
+# orjson序列化选项: 缩进输出 + 原生支持numpy/datetime对象
+_ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
 # 添加src目录到路径
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -91,18 +96,16 @@ def monitor_protocols(args):
         data = [monitor.get_tvl(args.protocol), monitor.get_price(args.protocol)]
     
     if args.json:
-        import json
-        print(json.dumps(data, indent=2))
+        print(orjson.dumps(data, option=_ORJSON_OPTS).decode())
     else:
         for d in data:
             print(f"\n{d.get('name', 'Unknown')}:")
-            print(f"  TVL: ${d.get('tvl', 0):,.2f}")
-            print(f"  Price: ${d.get('price_usd', 0):,.2f}")
+            print(f"  TVL: ${d.get('tvl') or 0:,.2f}")
+            print(f"  Price: ${d.get('price_usd') or 0:,.2f}")
     
     if args.save:
-        import json
-        with open(args.save, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(args.save, 'wb') as f:
+            f.write(orjson.dumps(data, option=_ORJSON_OPTS))
         print(f"\n✅ 数据已保存到 {args.save}")
 
 
@@ -135,8 +138,7 @@ def generate_report(args):
     visualizer = Visualizer({})
     
     if args.format == "json":
-        import json
-        output = json.dumps(data, indent=2)
+        output = orjson.dumps(data, option=_ORJSON_OPTS).decode()
     elif args.format == "html":
         output = visualizer.generate_html_report(data)
     else:
@@ -152,28 +154,36 @@ def generate_report(args):
 
 def manage_config(args):
     """配置管理"""
+    import os
     import yaml
-    
+
+    # libyaml C绑定比纯Python解析快5-10倍, 未安装时回退纯Python实现
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
     config_path = Path(__file__).parent / "config.yaml"
-    
+
     if args.show:
         if config_path.exists():
             with open(config_path) as f:
                 print(f.read())
         else:
             print("配置文件不存在")
-    
+
     elif args.set:
         key, value = args.set
         config = {}
         if config_path.exists():
             with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
-        
+                config = yaml.load(f, Loader=loader) or {}
+
         config[key] = value
-        
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f)
+
+        # 先写临时文件再原子替换, 写入中断也不会留下损坏的配置
+        tmp_path = config_path.with_suffix(".yaml.tmp")
+        with open(tmp_path, 'w') as f:
+            yaml.dump(config, f, Dumper=dumper)
+        os.replace(tmp_path, config_path)
         print(f"✅ 已设置 {key} = {value}")
 
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+DeFi Monitor - 调试工具
+
+流式检查DefiLlama /protocol/{slug} 的原始返回:
+    python3 debug_monitor.py aave-v3
+"""
+
+import sys
+
+import ijson
+import requests
+
+BASE_URL = "https://api.llama.fi"
+
+
+def get_tvl_debug(slug="aave-v3"):
+    """流式拉取协议TVL历史的前3条记录
+
+    /protocol/{slug} 的历史TVL数组可达几十MB; ijson边下载边解析,
+    取到前3条即停止, 内存占用从O(历史长度)降到O(1), 也省掉了
+    整包json解析的约1秒开销。
+    """
+    url = f"{BASE_URL}/protocol/{slug}"
+    print(f"GET {url}")
+
+    response = requests.get(url, stream=True, timeout=10)
+    response.raise_for_status()
+    response.raw.decode_content = True
+
+    first_three = []
+    for i, item in enumerate(ijson.items(response.raw, "tvl.item")):
+        first_three.append(item)
+        if i >= 2:
+            break
+    response.close()
+
+    print(f"\ntvl历史前{len(first_three)}条:")
+    for item in first_three:
+        print(f"  {item}")
+    return first_three
+
+
+if __name__ == "__main__":
+    get_tvl_debug(sys.argv[1] if len(sys.argv) > 1 else "aave-v3")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+DeFi Monitor - 快速开始示例
+
+并发拉取三个协议的TVL和价格:
+    python3 examples/quick_start.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from coingecko import CoinGeckoClient
+from defi_llama import DefiLlamaClient
+
+# (显示名, DefiLlama slug, CoinGecko id)
+PROTOCOLS = [
+    ("Aave V3", "aave-v3", "aave"),
+    ("Lido", "lido", "lido-dao"),
+    ("EigenLayer", "eigenlayer", "eigenlayer"),
+]
+
+
+async def quick_monitor():
+    """并发获取所有协议数据
+
+    三个TVL请求并发发出, 三个价格查询合并为一次批量
+    /simple/price请求, 总耗时约等于最慢的一次往返。
+    """
+    defillama = DefiLlamaClient()
+    coingecko = CoinGeckoClient()
+    coin_ids = [coin_id for _, _, coin_id in PROTOCOLS]
+
+    try:
+        results = await asyncio.gather(
+            *[defillama.aget_protocol_tvl(slug) for _, slug, _ in PROTOCOLS],
+            coingecko.aget_token_prices(coin_ids),
+        )
+    finally:
+        await defillama.aclose()
+        await coingecko.aclose()
+
+    tvls, prices = results[:-1], results[-1] or {}
+
+    print("=" * 40)
+    print("DeFi Monitor 快速概览")
+    print("=" * 40)
+
+    for i, (name, _, coin_id) in enumerate(PROTOCOLS):
+        tvl_data = tvls[i] or {}
+        price_data = prices.get(coin_id) or {}
+        tvl = tvl_data.get("tvl")
+        price = price_data.get("price")
+
+        print(f"\n{name}:")
+        print(f"  TVL: ${tvl:,.0f}" if tvl is not None else "  TVL: N/A")
+        print(f"  价格: ${price:,.2f}" if price is not None else "  价格: N/A")
+
+
+if __name__ == "__main__":
+    asyncio.run(quick_monitor())
@@ -32,7 +32,10 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.31.0",
-        "web3>=6.11.0",
+        "orjson>=3.9.0",
+        "httpx[http2]>=0.25.0",
+        "web3>=7.0.0",
+        "cachetools>=5.3.0",
         "pyyaml>=6.0",
         "python-dotenv>=1.0.0",
         "pandas>=2.0.0",
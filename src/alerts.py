@@ -0,0 +1,196 @@
+"""
+价格预警模块
+
+- 预警规则管理 (供cli.py的alert命令使用)
+- 对比两次监控数据, 检测价格/TVL/APY的大幅变动
+- 通过Discord Webhook推送预警
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import orjson
+import requests
+
+# 方向/严重度查表: 避免每次检查都重建相同的字符串和分支
+_DIR = ("📉 DECREASED", "📈 INCREASED")
+_SEVERITY_COLORS = {"HIGH": 0xE74C3C, "MEDIUM": 0xF39C12}
+
+# 跨调用复用的Webhook会话: TLS握手只付一次
+_discord_session = requests.Session()
+
+# Discord单条消息最多允许10个embed
+_EMBEDS_PER_POST = 10
+
+
+def _classify(change, hi_threshold):
+    """根据变动幅度返回(方向, 严重度)"""
+    return _DIR[change > 0], ("HIGH" if abs(change) >= hi_threshold else "MEDIUM")
+
+
+class PriceAlerts:
+    """价格预警管理器"""
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.price_threshold = config.get("price_threshold", 5.0)  # %
+        self.tvl_threshold = config.get("tvl_threshold", 10.0)  # %
+        self.apy_threshold = config.get("apy_threshold", 20.0)  # %
+        self.discord_webhook = config.get("discord_webhook")
+        self.alerts_file = Path(config.get("alerts_file", "alerts.json"))
+        self.state_file = Path(config.get("state_file", ".alerts_state.json"))
+
+        # 上一轮监控数据: 协议名 -> 数据dict。
+        # 从磁盘快照恢复, 重启后第一轮即可触发预警, 不用白跑一轮建基线
+        self.previous_data = self._load_state()
+
+    def _load_state(self):
+        try:
+            return orjson.loads(self.state_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_state(self):
+        try:
+            self.state_file.write_bytes(orjson.dumps(self.previous_data))
+        except (OSError, TypeError) as e:
+            print(f"[WARN] 预警基线快照保存失败: {e}")
+
+    # ------------------------------------------------------------------
+    # 预警规则管理
+    # ------------------------------------------------------------------
+
+    def _load_rules(self):
+        if self.alerts_file.exists():
+            return orjson.loads(self.alerts_file.read_bytes())
+        return []
+
+    def _save_rules(self, rules):
+        self.alerts_file.write_bytes(orjson.dumps(rules, option=orjson.OPT_INDENT_2))
+
+    def list_alerts(self):
+        """列出所有预警规则"""
+        return self._load_rules()
+
+    def add_alert(self, token, price, direction="above"):
+        """添加预警规则"""
+        rules = self._load_rules()
+        next_id = max((r["id"] for r in rules), default=0) + 1
+        rules.append({
+            "id": next_id,
+            "token": token,
+            "price": price,
+            "direction": direction,
+        })
+        self._save_rules(rules)
+        return next_id
+
+    def remove_alert(self, alert_id):
+        """删除指定ID的预警规则"""
+        rules = [r for r in self._load_rules() if r["id"] != alert_id]
+        self._save_rules(rules)
+
+    # ------------------------------------------------------------------
+    # 数据变动检测
+    # ------------------------------------------------------------------
+
+    def check_alerts(self, current_data):
+        """对比上一轮数据, 返回触发的预警列表
+
+        阈值过滤按SoA(每个指标一个NumPy数组)向量化: 百分比变动和
+        阈值比较在C层一次完成, 只为命中的少数协议构造预警dict,
+        Python循环开销不再随协议数线性放大。
+        """
+        alerts = []
+        count = len(current_data)
+        # 单次遍历: 取出旧基线的同时就地写入新基线,
+        # 不再在检查之后多跑一轮更新循环
+        names = []
+        prevs = []
+        for protocol_data in current_data:
+            name = protocol_data.get("name")
+            names.append(name)
+            if name:
+                prevs.append(self.previous_data.get(name))
+                # 基线统一存dict: ProtocolRecord有get()可直接参与检查,
+                # 但orjson序列化不了槽类对象, 入库前先归一化
+                self.previous_data[name] = (
+                    protocol_data.to_dict()
+                    if hasattr(protocol_data, "to_dict") else protocol_data)
+            else:
+                prevs.append(None)
+        # 整轮共用一个时间戳: 省掉每条预警一次时钟读取+datetime分配,
+        # 同一轮触发的预警时间也保持一致
+        now_iso = datetime.now().isoformat()
+
+        for kind, field, threshold in (
+            ("price", "price_usd", self.price_threshold),
+            ("tvl", "tvl", self.tvl_threshold),
+            ("apy", "apy", self.apy_threshold),
+        ):
+            old = np.fromiter(
+                ((p or {}).get(field) or np.nan for p in prevs),
+                dtype=np.float64, count=count,
+            )
+            new = np.fromiter(
+                (d.get(field) if d.get(field) is not None else np.nan
+                 for d in current_data),
+                dtype=np.float64, count=count,
+            )
+            with np.errstate(invalid="ignore"):
+                pct = (new - old) / old * 100
+            # NaN(缺失值)与阈值比较恒为False, 自动被过滤掉
+            hits = np.where(np.abs(pct) >= threshold)[0]
+            for i in hits:
+                alerts.append(self._build_alert(
+                    kind, names[i], old[i], new[i], pct[i], threshold, now_iso))
+
+        self._save_state()
+
+        if alerts and self.discord_webhook:
+            self._send_discord_alerts(alerts)
+        return alerts
+
+    def _build_alert(self, kind, name, old, new, change, threshold, timestamp):
+        # pct数组里取出的是np.float64, NumPy 2.x下np.bool_不能当
+        # tuple索引, 进_classify前先转回原生float
+        change = float(change)
+        direction, severity = _classify(change, threshold * 2)
+        return {
+            "type": kind,
+            "protocol": name,
+            "message": f"{name} {kind} {direction} by {abs(change):.2f}%",
+            "severity": severity,
+            "old_value": float(old),
+            "new_value": float(new),
+            "change_pct": float(change),
+            "timestamp": timestamp,
+        }
+
+    # ------------------------------------------------------------------
+    # Discord通知
+    # ------------------------------------------------------------------
+
+    def _build_embed(self, alert):
+        return {
+            "title": f"DeFi Monitor 预警: {alert['protocol']}",
+            "description": alert["message"],
+            "color": _SEVERITY_COLORS.get(alert["severity"], 0x95A5A6),
+            "timestamp": alert["timestamp"],
+        }
+
+    def _send_discord_alerts(self, alerts):
+        """推送预警到Discord Webhook (每次请求批量携带最多10个embed)"""
+        embeds = [self._build_embed(a) for a in alerts]
+        for start in range(0, len(embeds), _EMBEDS_PER_POST):
+            chunk = embeds[start:start + _EMBEDS_PER_POST]
+            try:
+                _discord_session.post(
+                    self.discord_webhook,
+                    data=orjson.dumps({"embeds": chunk}),
+                    headers={"Content-Type": "application/json"},
+                    timeout=10,
+                )
+            except requests.RequestException as e:
+                print(f"[WARN] Discord通知发送失败: {e}")
@@ -0,0 +1,54 @@
+"""
+缓存工具
+
+endpoint -> payload 的TTL缓存, 带可选磁盘层: 同一进程内命中
+内存, 跨进程/重启命中磁盘快照 (按键哈希存orjson文件)。
+"""
+
+import hashlib
+import time
+from pathlib import Path
+
+import orjson
+
+
+class TTLCache:
+    """进程内TTL缓存 + 可选磁盘持久层"""
+
+    def __init__(self, ttl=60, disk_dir=None):
+        self.ttl = ttl
+        self._mem = {}  # key -> (payload, 过期时间戳)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.disk_dir / f"{digest}.json"
+
+    def get(self, key):
+        entry = self._mem.get(key)
+        if entry and time.time() < entry[1]:
+            return entry[0]
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                mtime = path.stat().st_mtime
+                if time.time() - mtime < self.ttl:
+                    data = orjson.loads(path.read_bytes())
+                    self._mem[key] = (data, mtime + self.ttl)
+                    return data
+            except (OSError, orjson.JSONDecodeError):
+                pass
+        return None
+
+    def put(self, key, data):
+        if data is None:
+            return
+        self._mem[key] = (data, time.time() + self.ttl)
+        if self.disk_dir:
+            try:
+                self._disk_path(key).write_bytes(orjson.dumps(data))
+            except (OSError, TypeError):
+                pass
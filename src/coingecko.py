@@ -0,0 +1,232 @@
+"""
+CoinGecko API客户端
+
+提供代币价格、市值、行情等数据
+API文档: https://www.coingecko.com/en/api/documentation
+
+免费版限制: 约30次请求/分钟, 无需API Key
+"""
+
+import asyncio
+import time
+from urllib.parse import quote, urlencode
+
+import httpx
+import orjson
+
+from cache import TTLCache
+from http_client import make_async_client, make_client
+from rate_limit import TokenBucket
+
+
+class CoinGeckoClient:
+    """CoinGecko API客户端"""
+
+    BASE_URL = "https://api.coingecko.com/api/v3"
+
+    def __init__(self, config=None, client=None):
+        config = config or {}
+        self.base_url = config.get("base_url", self.BASE_URL)
+        self.rate_limit = config.get("rate_limit", 30)  # 每分钟最大请求数
+        # 令牌桶: 允许突发到配额上限, 线程池并发下也安全
+        self.bucket = TokenBucket(self.rate_limit)
+
+        # TTL缓存: 行情数据分钟级新鲜度足够, 命中既省往返也省限速配额;
+        # 配置cache_dir后加磁盘层, 跨CLI调用也能命中
+        self.cache = TTLCache(
+            ttl=config.get("cache_ttl", 60),
+            disk_dir=config.get("cache_dir"),
+        )
+
+        # HTTP/2客户端: 多个并发请求复用同一条TCP+TLS连接(多路复用),
+        # HPACK头部压缩减少批量行情请求的开销。
+        # 传入client可与其他组件共享同一个连接池
+        self._owns_client = client is None
+        self.client = client if client is not None else make_client()
+        # 异步客户端按需创建 (必须在事件循环内构造)
+        self._aclient = None
+
+        # 预编译常用端点的固定参数片段: 每次调用只拼接变化的id部分,
+        # 并让等价请求生成完全一致的URL, 与TTL缓存键精确对齐
+        self._price_prefix = "/simple/price?" + urlencode({
+            "vs_currencies": "usd",
+            "include_24hr_change": "true",
+            "include_market_cap": "true",
+        }) + "&ids="
+        self._markets_prefix = "/coins/markets?" + urlencode({
+            "vs_currency": "usd",
+            "order": "market_cap_desc",
+            "page": 1,
+        }) + "&per_page="
+
+        # 轮询场景下同一端点反复请求: Request对象构建一次后复用,
+        # URL解析/头部合并移出热路径 (上限防止搜索类端点无界增长)
+        self._requests = {}  # endpoint -> httpx.Request
+        self._arequests = {}
+        self._request_memo_max = 256
+
+        # 预热连接: 提前完成DNS+TCP+TLS握手(~300ms),
+        # 第一次真正的行情请求直接复用keep-alive连接
+        if config.get("preconnect", True):
+            try:
+                self.client.head(f"{self.base_url}/ping", timeout=5)
+            except httpx.HTTPError:
+                pass
+
+    def close(self):
+        """关闭HTTP连接 (共享的客户端由创建方负责关闭)"""
+        if self._owns_client:
+            self.client.close()
+
+    async def aclose(self):
+        """关闭异步HTTP连接"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _ensure_aclient(self):
+        if self._aclient is None:
+            self._aclient = make_async_client()
+        return self._aclient
+
+    def _make_request(self, endpoint):
+        """发送GET请求 (带限速和TTL缓存)"""
+        cached = self.cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        self.bucket.acquire()
+
+        request = self._requests.get(endpoint)
+        if request is None:
+            request = self.client.build_request("GET", f"{self.base_url}{endpoint}")
+            if len(self._requests) < self._request_memo_max:
+                self._requests[endpoint] = request
+
+        try:
+            for _ in range(5):
+                response = self.client.send(request)
+                if response.status_code == 429:
+                    # 有界重试并遵循Retry-After, 避免限流风暴下无限递归
+                    time.sleep(float(response.headers.get("Retry-After", 60)))
+                    continue
+                break
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.cache.put(endpoint, data)
+            return data
+        except httpx.HTTPError as e:
+            print(f"[WARN] CoinGecko请求失败: {endpoint} - {e}")
+            return None
+
+    async def _amake_request(self, endpoint):
+        """发送异步GET请求 (带TTL缓存)"""
+        cached = self.cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        await self.bucket.aacquire()
+
+        client = self._ensure_aclient()
+        request = self._arequests.get(endpoint)
+        if request is None:
+            request = client.build_request("GET", f"{self.base_url}{endpoint}")
+            if len(self._arequests) < self._request_memo_max:
+                self._arequests[endpoint] = request
+
+        try:
+            for _ in range(5):
+                response = await client.send(request)
+                if response.status_code == 429:
+                    await asyncio.sleep(float(response.headers.get("Retry-After", 60)))
+                    continue
+                break
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.cache.put(endpoint, data)
+            return data
+        except httpx.HTTPError as e:
+            print(f"[WARN] CoinGecko请求失败: {endpoint} - {e}")
+            return None
+
+    def _price_endpoint(self, coin_ids, vs_currency):
+        # id统一小写并排序, 保证等价查询落在同一个TTL缓存键上;
+        # quote/urlencode同时正确转义保留字符
+        ids = ",".join(sorted(c.lower() for c in coin_ids))
+        if vs_currency == "usd":
+            return self._price_prefix + quote(ids, safe="")
+        params = {
+            "ids": ids,
+            "vs_currencies": vs_currency,
+            "include_24hr_change": "true",
+            "include_market_cap": "true",
+        }
+        return f"/simple/price?{urlencode(params)}"
+
+    @staticmethod
+    def _parse_prices(data, coin_ids, vs_currency):
+        """从/simple/price响应中按id提取各代币价格"""
+        result = {}
+        for coin_id in coin_ids:
+            token = (data or {}).get(coin_id.lower())
+            result[coin_id] = {
+                "price": token.get(vs_currency),
+                "change_24h": token.get(f"{vs_currency}_24h_change"),
+                "market_cap": token.get(f"{vs_currency}_market_cap"),
+            } if token else None
+        return result
+
+    def get_token_prices(self, coin_ids, vs_currency="usd"):
+        """批量获取多个代币价格 (单次请求)
+
+        /simple/price原生支持逗号分隔的ids, N个代币只需一次往返
+        和一次限速等待。
+        """
+        endpoint = self._price_endpoint(coin_ids, vs_currency)
+        return self._parse_prices(self._make_request(endpoint), coin_ids, vs_currency)
+
+    async def aget_token_prices(self, coin_ids, vs_currency="usd"):
+        """批量获取多个代币价格 (异步)"""
+        endpoint = self._price_endpoint(coin_ids, vs_currency)
+        return self._parse_prices(await self._amake_request(endpoint), coin_ids, vs_currency)
+
+    def get_token_price(self, coin_id, vs_currency="usd"):
+        """获取代币价格 (含24h涨跌幅和市值)"""
+        return self.get_token_prices([coin_id], vs_currency).get(coin_id)
+
+    async def aget_token_price(self, coin_id, vs_currency="usd"):
+        """获取代币价格 (异步)"""
+        return (await self.aget_token_prices([coin_id], vs_currency)).get(coin_id)
+
+    def get_top_tokens(self, limit=10, vs_currency="usd"):
+        """获取市值排名前N的代币"""
+        if vs_currency == "usd":
+            return self._make_request(self._markets_prefix + str(limit))
+        params = {
+            "vs_currency": vs_currency,
+            "order": "market_cap_desc",
+            "per_page": limit,
+            "page": 1,
+        }
+        return self._make_request(f"/coins/markets?{urlencode(params)}")
+
+    def search_tokens(self, query):
+        """搜索代币"""
+        data = self._make_request(f"/search?{urlencode({'query': query})}")
+        return data.get("coins", []) if data else []
+
+    def get_token_market_data(self, coin_id):
+        """获取代币详细行情数据"""
+        params = {
+            "localization": "false",
+            "tickers": "false",
+            "community_data": "false",
+            "developer_data": "false",
+        }
+        return self._make_request(f"/coins/{coin_id.lower()}?{urlencode(params)}")
@@ -0,0 +1,204 @@
+"""
+数据获取模块
+
+统一封装DefiLlama/CoinGecko数据拉取, 供monitor和visualizer使用。
+所有上游请求共用一个HTTP/2连接池。
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+import numpy as np
+import orjson
+
+from coingecko import CoinGeckoClient
+from defi_llama import DefiLlamaClient
+from http_client import make_client
+
+# 热路径进度输出走logger: 比逐条print少系统调用,
+# 并发拉取时不串行化线程输出, 调级别即可整体静音
+logger = logging.getLogger(__name__)
+
+
+class ProtocolRecord:
+    """单个协议的监控快照
+
+    槽类代替dict: 每条记录省掉dict的哈希表开销, 属性访问
+    也比.get()快。保留get()兼容旧的dict式调用方,
+    to_dict()只在JSON落盘边界使用。
+    """
+
+    __slots__ = ("name", "tvl", "price_usd", "apy",
+                 "change_24h", "market_cap", "timestamp")
+
+    def __init__(self, name, tvl=None, price_usd=None, apy=None,
+                 change_24h=None, market_cap=None, timestamp=None):
+        self.name = name
+        self.tvl = tvl
+        self.price_usd = price_usd
+        self.apy = apy
+        self.change_24h = change_24h
+        self.market_cap = market_cap
+        self.timestamp = timestamp
+
+    def get(self, field, default=None):
+        """dict式访问兼容接口"""
+        value = getattr(self, field, None)
+        return value if value is not None else default
+
+    def to_dict(self):
+        """转为dict (JSON序列化边界用)"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return f"ProtocolRecord(name={self.name!r}, tvl={self.tvl!r})"
+
+
+def records_to_soa(records):
+    """把记录列表 (AoS) 转成每字段一个NumPy数组 (SoA)
+
+    单次遍历建好全部字段数组, 下游绘图/聚合共享这一次提取,
+    数值运算走向量化路径而不是逐条dict查找。
+    """
+    count = len(records)
+
+    def column(field):
+        return np.fromiter(
+            (r.get(field) if r.get(field) is not None else np.nan for r in records),
+            dtype=np.float64, count=count,
+        )
+
+    return {
+        "name": np.array([(r.get("name") or "?").upper() for r in records],
+                         dtype=object),
+        "tvl": column("tvl"),
+        "price": column("price_usd"),
+        "apy": column("apy"),
+        "change_24h": column("change_24h"),
+    }
+
+
+def quantize_floats(value):
+    """递归把float舍入到6位小数
+
+    行情数据常带十几位无意义小数, 舍入后JSON文本明显更短,
+    序列化和落盘都更快。
+    """
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, list):
+        return [quantize_floats(v) for v in value]
+    if isinstance(value, dict):
+        return {k: quantize_floats(v) for k, v in value.items()}
+    return value
+
+
+class DataFetcher:
+    """DeFi协议数据获取器"""
+
+    def __init__(self, config=None, client=None):
+        config = config or {}
+        # 与两个API客户端共享同一个连接池
+        self._owns_client = client is None
+        self.client = client if client is not None else make_client()
+        self.defillama = DefiLlamaClient(config.get("defi_llama"), client=self.client)
+        self.coingecko = CoinGeckoClient(config.get("coingecko"), client=self.client)
+
+    def close(self):
+        """关闭HTTP连接"""
+        if self._owns_client:
+            self.client.close()
+
+    @staticmethod
+    def _build_record(protocol, tvl_data, price_data):
+        return ProtocolRecord(
+            name=protocol["name"],
+            tvl=(tvl_data or {}).get("tvl"),
+            price_usd=(price_data or {}).get("price"),
+            change_24h=(price_data or {}).get("change_24h"),
+            market_cap=(price_data or {}).get("market_cap"),
+            timestamp=datetime.now().isoformat(),
+        )
+
+    def fetch_protocol_data(self, protocol):
+        """获取单个协议数据
+
+        protocol: {"name", "defi_llama_slug", "coingecko_id"}
+        """
+        tvl_data = self.defillama.get_protocol_tvl(protocol["defi_llama_slug"])
+        price_data = self.coingecko.get_token_price(protocol["coingecko_id"])
+        return self._build_record(protocol, tvl_data, price_data)
+
+    async def fetch_protocol_data_async(self, protocol):
+        """获取单个协议数据 (异步, TVL与价格请求并发)"""
+        tvl_data, price_data = await asyncio.gather(
+            self.defillama.aget_protocol_tvl(protocol["defi_llama_slug"]),
+            self.coingecko.aget_token_price(protocol["coingecko_id"]),
+        )
+        return self._build_record(protocol, tvl_data, price_data)
+
+    async def fetch_all_protocols_async(self, protocols, max_concurrency=20):
+        """并发获取所有协议数据 (协议间与协议内请求全部重叠)
+
+        所有代币价格合并为一次批量/simple/price请求, TVL请求
+        与之并发; 单协议耗时降为其最慢端点的耗时, 信号量限制
+        在飞请求数, 避免压垮上游。
+        """
+        protocols = list(protocols)
+        if not protocols:
+            return []
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_tvl(slug):
+            async with semaphore:
+                return await self.defillama.aget_protocol_tvl(slug)
+
+        coin_ids = [p["coingecko_id"] for p in protocols]
+        started = time.perf_counter()
+        prices, *tvls = await asyncio.gather(
+            self.coingecko.aget_token_prices(coin_ids),
+            *[fetch_tvl(p["defi_llama_slug"]) for p in protocols],
+        )
+        prices = prices or {}
+        records = [
+            self._build_record(p, tvl, prices.get(p["coingecko_id"]))
+            for p, tvl in zip(protocols, tvls)
+        ]
+        # 并发期间不逐条打日志, 结束后只汇总一条
+        logger.info("✅ 已获取 %d 个协议数据 (%.0fms)",
+                    len(records), (time.perf_counter() - started) * 1000)
+        return records
+
+    def fetch_all_protocols(self, protocols):
+        """并发获取所有协议数据 (同步入口, 调用方无需改动)"""
+        protocols = list(protocols)
+        if not protocols:
+            return []
+
+        async def run():
+            try:
+                return await self.fetch_all_protocols_async(protocols)
+            finally:
+                # 异步客户端绑定当前事件循环, 退出前关闭以便下次重建
+                await self.defillama.aclose()
+                await self.coingecko.aclose()
+
+        return asyncio.run(run())
+
+    def fetch_all_protocols_soa(self, protocols):
+        """并发获取所有协议数据并按SoA布局返回
+
+        返回{"name", "tvl", "price", "apy", "change_24h"}字段数组,
+        可直接喂给Visualizer而无需再做逐记录提取。
+        """
+        return records_to_soa(self.fetch_all_protocols(protocols))
+
+    def save_data(self, data, filename="defi_data.json"):
+        """保存数据到JSON文件 (紧凑格式, float压到6位小数)"""
+        payload = [d.to_dict() if isinstance(d, ProtocolRecord) else d for d in data]
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(quantize_floats(payload),
+                                 option=orjson.OPT_APPEND_NEWLINE))
+        print(f"✅ 数据已保存到 {filename}")
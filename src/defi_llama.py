@@ -0,0 +1,231 @@
+"""
+DefiLlama API客户端
+
+提供DeFi协议TVL数据
+API文档: https://defillama.com/docs/api
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+import httpx
+import orjson
+
+from cache import TTLCache
+from http_client import make_async_client, make_client
+from rate_limit import TokenBucket
+
+
+class DefiLlamaClient:
+    """DefiLlama API客户端 (免费, 无需API Key)"""
+
+    BASE_URL = "https://api.llama.fi"
+    YIELDS_URL = "https://yields.llama.fi/pools"
+
+    def __init__(self, config=None, client=None):
+        config = config or {}
+        self.base_url = config.get("base_url", self.BASE_URL)
+        self.rate_limit = config.get("rate_limit", 120)  # 每分钟最大请求数
+        # 令牌桶: 允许突发到配额上限, 线程池并发下也安全
+        self.bucket = TokenBucket(self.rate_limit)
+
+        # TTL缓存: TVL聚合数据分钟级新鲜度足够;
+        # 配置cache_dir后加磁盘层, 跨CLI调用也能命中
+        self.cache = TTLCache(
+            ttl=config.get("cache_ttl", 60),
+            disk_dir=config.get("cache_dir"),
+        )
+
+        # /pools全量收益率数据单独缓存: payload可达数MB,
+        # 监控N个协议时只应下载和解析一次
+        self._yields_ttl = config.get("yields_ttl", 60)
+        self._yields_index = None  # project -> [pool, ...]
+        self._yields_cache_ts = 0.0
+        self._yields_lock = threading.Lock()
+
+        # 派生字符串只算一次: 固定协议集下端点和完整URL在首次
+        # 使用后直接命中memo, 热路径不再重复f-string拼接
+        self._protocol_endpoints = {}  # slug -> "/protocol/{slug}"
+        self._endpoint_urls = {}  # endpoint -> base_url + endpoint
+
+        # 条件请求: 记住每个端点的ETag和上一份解析结果,
+        # TTL过期后带If-None-Match重验, 304时只传头部不传payload
+        self._etags = {}  # endpoint -> ETag
+        self._body_cache = {}  # endpoint -> 上次200响应的解析结果
+
+        # 传入client可与其他组件共享同一个连接池
+        self._owns_client = client is None
+        self.client = client if client is not None else make_client()
+        # 异步客户端按需创建 (必须在事件循环内构造)
+        self._aclient = None
+
+    def close(self):
+        """关闭HTTP连接 (共享的客户端由创建方负责关闭)"""
+        if self._owns_client:
+            self.client.close()
+
+    async def aclose(self):
+        """关闭异步HTTP连接"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _ensure_aclient(self):
+        if self._aclient is None:
+            self._aclient = make_async_client()
+        return self._aclient
+
+    def _endpoint_url(self, endpoint):
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = self.base_url + endpoint
+        return url
+
+    def _conditional_headers(self, endpoint):
+        etag = self._etags.get(endpoint)
+        return {"If-None-Match": etag} if etag else None
+
+    def _store_response(self, endpoint, response):
+        """解析200响应并更新TTL缓存和ETag验证器"""
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[endpoint] = etag
+            self._body_cache[endpoint] = data
+        self.cache.put(endpoint, data)
+        return data
+
+    def _revalidated(self, endpoint):
+        """304时复用上一份解析结果 (并刷新TTL)"""
+        data = self._body_cache.get(endpoint)
+        if data is not None:
+            self.cache.put(endpoint, data)
+        return data
+
+    def _make_request(self, endpoint):
+        """发送GET请求 (带限速、TTL缓存和ETag条件请求)"""
+        cached = self.cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        self.bucket.acquire()
+
+        try:
+            response = self.client.get(self._endpoint_url(endpoint),
+                                       headers=self._conditional_headers(endpoint))
+            if response.status_code == 304:
+                return self._revalidated(endpoint)
+            response.raise_for_status()
+            return self._store_response(endpoint, response)
+        except httpx.HTTPError as e:
+            print(f"[WARN] DefiLlama请求失败: {endpoint} - {e}")
+            return None
+
+    async def _amake_request(self, endpoint):
+        """发送异步GET请求 (带TTL缓存和ETag条件请求)"""
+        cached = self.cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        await self.bucket.aacquire()
+
+        client = self._ensure_aclient()
+        try:
+            response = await client.get(self._endpoint_url(endpoint),
+                                        headers=self._conditional_headers(endpoint))
+            if response.status_code == 304:
+                return self._revalidated(endpoint)
+            response.raise_for_status()
+            return self._store_response(endpoint, response)
+        except httpx.HTTPError as e:
+            print(f"[WARN] DefiLlama请求失败: {endpoint} - {e}")
+            return None
+
+    @staticmethod
+    def _parse_protocol(data, slug):
+        """从/protocol/{slug}响应中提取当前TVL"""
+        if not data:
+            return None
+        history = data.get("tvl") or []
+        current = history[-1].get("totalLiquidityUSD") if history else None
+        return {
+            "name": data.get("name", slug),
+            "symbol": data.get("symbol"),
+            "tvl": current,
+        }
+
+    def _get_yields_index(self):
+        """拉取全量收益率列表并按project分组 (TTL缓存)
+
+        分组在payload落地时一次完成(O(池子总数)), 之后每个协议的
+        查询都是O(1)字典命中, 而不是每次扫描上万个池子。
+        """
+        with self._yields_lock:
+            if (self._yields_index is not None
+                    and time.monotonic() - self._yields_cache_ts < self._yields_ttl):
+                return self._yields_index
+
+            self.bucket.acquire()
+            try:
+                response = self.client.get(self.YIELDS_URL)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except httpx.HTTPError as e:
+                print(f"[WARN] DefiLlama请求失败: /pools - {e}")
+                return self._yields_index
+
+            index = defaultdict(list)
+            for pool in data.get("data", []):
+                index[pool.get("project")].append(pool)
+            self._yields_index = index
+            self._yields_cache_ts = time.monotonic()
+            return index
+
+    def get_protocol_yields(self, slug):
+        """获取指定协议的收益率池子列表"""
+        index = self._get_yields_index()
+        if not index:
+            return None
+        return index.get(slug) or None
+
+    def _protocol_endpoint(self, slug):
+        endpoint = self._protocol_endpoints.get(slug)
+        if endpoint is None:
+            endpoint = self._protocol_endpoints[slug] = f"/protocol/{slug}"
+        return endpoint
+
+    def _get_protocol_raw(self, slug):
+        """获取/protocol/{slug}原始响应 (TTL缓存)
+
+        当前TVL和历史曲线来自同一份payload, 各接口都从这里取数,
+        同一个协议在TTL内只下载和解析一次。
+        """
+        return self._make_request(self._protocol_endpoint(slug))
+
+    def get_protocol_tvl(self, slug):
+        """获取协议当前TVL"""
+        return self._parse_protocol(self._get_protocol_raw(slug), slug)
+
+    async def aget_protocol_tvl(self, slug):
+        """获取协议当前TVL (异步)"""
+        return self._parse_protocol(
+            await self._amake_request(self._protocol_endpoint(slug)), slug)
+
+    def get_protocol_history(self, slug, days=None):
+        """获取协议TVL历史序列
+
+        返回[{date, totalLiquidityUSD}, ...]; days限制只取最近N天。
+        与get_protocol_tvl共享同一份缓存payload, 不会二次下载。
+        """
+        data = self._get_protocol_raw(slug)
+        if not data:
+            return None
+        history = data.get("tvl") or []
+        return history[-days:] if days else history
@@ -0,0 +1,33 @@
+"""
+共享HTTP客户端构造
+
+所有上游API统一使用HTTP/2 + 连接池配置; 各组件间传入同一个
+实例即可共享keep-alive连接, 避免每个组件各开一个池。
+"""
+
+import httpx
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+DEFAULT_HEADERS = {"Accept": "application/json"}
+
+
+def make_client():
+    """创建带HTTP/2和连接池的同步客户端"""
+    return httpx.Client(
+        http2=True,
+        timeout=DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+        limits=DEFAULT_LIMITS,
+        transport=httpx.HTTPTransport(retries=3),
+    )
+
+
+def make_async_client():
+    """创建带HTTP/2和连接池的异步客户端"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+        limits=DEFAULT_LIMITS,
+    )
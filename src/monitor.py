@@ -0,0 +1,127 @@
+"""
+DeFi协议监控核心模块
+
+拉取各协议的TVL和价格数据并生成监控报告:
+    python3 src/monitor.py
+"""
+
+import logging
+from datetime import datetime
+
+import orjson
+
+from data_fetcher import DataFetcher, quantize_floats
+
+# 支持的协议: key -> {显示名, DefiLlama slug, CoinGecko id}
+PROTOCOLS = {
+    "aave": {
+        "name": "Aave V3",
+        "defi_llama_slug": "aave-v3",
+        "coingecko_id": "aave",
+    },
+    "lido": {
+        "name": "Lido",
+        "defi_llama_slug": "lido",
+        "coingecko_id": "lido-dao",
+    },
+    "eigenlayer": {
+        "name": "EigenLayer",
+        "defi_llama_slug": "eigenlayer",
+        "coingecko_id": "eigenlayer",
+    },
+}
+
+
+class DeFiMonitor:
+    """DeFi协议监控器"""
+
+    def __init__(self, config=None, fetcher=None):
+        config = config or {}
+        self.protocols = config.get("protocols", PROTOCOLS)
+
+        # 取数统一走DataFetcher: 与visualizer同管线运行时传入同一个
+        # fetcher实例, 共享其连接池和TTL缓存, 同一份数据不会拉两次
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher if fetcher is not None else DataFetcher(config)
+        self.defillama = self.fetcher.defillama
+        self.coingecko = self.fetcher.coingecko
+
+    def close(self):
+        """关闭HTTP连接 (传入的fetcher由创建方负责关闭)"""
+        if self._owns_fetcher:
+            self.fetcher.close()
+
+    def get_tvl(self, protocol_key):
+        """获取单个协议的TVL"""
+        meta = self.protocols.get(protocol_key)
+        if not meta:
+            return {}
+        data = self.defillama.get_protocol_tvl(meta["defi_llama_slug"]) or {}
+        return {"name": meta["name"], "tvl": data.get("tvl")}
+
+    def get_price(self, protocol_key):
+        """获取单个协议代币价格"""
+        meta = self.protocols.get(protocol_key)
+        if not meta:
+            return {}
+        price = self.coingecko.get_token_price(meta["coingecko_id"]) or {}
+        return {
+            "name": meta["name"],
+            "price_usd": price.get("price"),
+            "change_24h": price.get("change_24h"),
+            "market_cap": price.get("market_cap"),
+        }
+
+    def get_all_protocols_data(self):
+        """并发获取所有协议数据 (委托给DataFetcher)
+
+        批量价格请求、并发fanout和汇总日志都在DataFetcher内完成,
+        这里只把记录映射回monitor的输出schema。
+        """
+        records = self.fetcher.fetch_all_protocols(self.protocols.values())
+        # gather保持提交顺序, 按protocols的key顺序补回protocol字段
+        return [
+            {"protocol": key, **record.to_dict()}
+            for key, record in zip(self.protocols, records)
+        ]
+
+    def generate_report(self, data):
+        """生成文本监控报告"""
+        # 每个协议一个多行f-string, 一次join成稿,
+        # 避免逐行append带来的列表扩容和临时字符串
+        header = (
+            "=" * 50,
+            "DeFi协议监控报告",
+            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 50,
+        )
+        body = (
+            f"\n### {i}. {p.get('name', 'Unknown')}\n"
+            f"- TVL: ${p.get('tvl') or 0:,.0f}\n"
+            f"- 价格: ${p.get('price_usd') or 0:,.2f}\n"
+            f"- 24h涨跌: {p.get('change_24h') or 0:+.2f}%"
+            for i, p in enumerate(data, 1)
+        )
+        return "\n".join((*header, *body))
+
+    def save_data(self, data, filename="defi_data.json"):
+        """保存数据到JSON文件 (紧凑格式, float压到6位小数)"""
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(quantize_floats(data),
+                                 option=orjson.OPT_APPEND_NEWLINE))
+        print(f"✅ 数据已保存到 {filename}")
+
+
+def main():
+    """命令行入口"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    monitor = DeFiMonitor()
+    try:
+        data = monitor.get_all_protocols_data()
+        print(monitor.generate_report(data))
+    finally:
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+限速工具
+
+令牌桶限速器: 容量决定突发上限, 令牌按速率持续补充;
+用threading.Lock保护, 线程池和事件循环并发下都可安全使用。
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """线程安全的令牌桶限速器"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.refill_rate = rate_per_minute / 60.0  # 每秒补充的令牌数
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """尝试取一个令牌; 成功返回0, 否则返回建议等待秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate,
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.refill_rate
+
+    def acquire(self):
+        """获取一个令牌, 不足时阻塞等待补充"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """获取一个令牌 (异步, 等待期间不阻塞事件循环)"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
@@ -0,0 +1,151 @@
+"""
+数据可视化模块
+
+生成协议对比图表和HTML/文本报告:
+    python3 src/visualizer.py
+"""
+
+from datetime import datetime
+
+import matplotlib
+
+matplotlib.use("Agg")  # 非交互后端: 不依赖GUI, 长驻监控循环内存更稳
+import matplotlib.pyplot as plt
+import numpy as np
+
+from data_fetcher import records_to_soa
+
+# 协议品牌色
+DEFAULT_COLORS = ["#B6509E", "#2EBAC6", "#1A1A2E", "#F39C12", "#27AE60"]
+
+
+class Visualizer:
+    """DeFi数据可视化"""
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.chart_size = config.get("chart_size", (14, 10))
+        self.colors = config.get("colors", DEFAULT_COLORS)
+
+        # 复用同一个Figure/axes: 每次报告只clear重画,
+        # 免去反复分配/销毁画布和重算GridSpec的开销
+        self.fig, self.axes = plt.subplots(2, 2, figsize=self.chart_size)
+
+    def _bar(self, ax, fields, values, title, ylabel, fmt):
+        bars = ax.bar(fields["name"], values, color=self.colors[:len(values)])
+        ax.set_title(title, fontweight="bold")
+        ax.set_ylabel(ylabel)
+        # bar_label一次挂上全部数值标注, 比逐根bar调ax.text少走
+        # N次Artist创建/布局路径
+        ax.bar_label(bars, labels=[fmt.format(v) for v in values],
+                     padding=3, fontweight="bold")
+        return bars
+
+    def _plot_tvl_comparison(self, ax, fields):
+        tvls = np.nan_to_num(fields["tvl"]) / 1e9
+        self._bar(ax, fields, tvls, "TVL对比", "TVL ($B)", "${:.2f}B")
+
+    def _plot_price_comparison(self, ax, fields):
+        prices = np.nan_to_num(fields["price"])
+        self._bar(ax, fields, prices, "代币价格", "价格 ($)", "${:.2f}")
+
+    def _plot_apy_comparison(self, ax, fields):
+        apys = np.nan_to_num(fields["apy"])
+        self._bar(ax, fields, apys, "收益率对比", "APY (%)", "{:.2f}%")
+
+    def _plot_change_comparison(self, ax, fields):
+        changes = np.nan_to_num(fields["change_24h"])
+        self._bar(ax, fields, changes, "24小时涨跌", "涨跌 (%)", "{:+.2f}%")
+        ax.axhline(0, color="gray", linewidth=0.8)
+
+    def generate_report(self, data, output="defi_report.png"):
+        """生成图表报告PNG
+
+        data既可以是记录列表, 也可以直接传
+        DataFetcher.fetch_all_protocols_soa的字段数组, 免去二次提取。
+        """
+        fields = data if isinstance(data, dict) else records_to_soa(data)
+
+        axes = self.axes
+        for row in axes:
+            for ax in row:
+                ax.clear()
+        self._plot_tvl_comparison(axes[0][0], fields)
+        self._plot_price_comparison(axes[0][1], fields)
+        self._plot_apy_comparison(axes[1][0], fields)
+        self._plot_change_comparison(axes[1][1], fields)
+
+        self.fig.suptitle(f"DeFi协议监控报告 {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+                          fontsize=14, fontweight="bold")
+        self.fig.tight_layout()
+        self.fig.savefig(output, dpi=150, pil_kwargs={"optimize": True})
+        print(f"✅ 图表已保存到 {output}")
+        return output
+
+    def generate_text_report(self, data):
+        """生成文本报告"""
+        # 每个协议一个多行f-string, 一次join成稿
+        header = (
+            "=" * 50,
+            "DeFi协议监控报告",
+            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 50,
+        )
+        body = (
+            f"\n### {i}. {d.get('name', 'Unknown')}\n"
+            f"- TVL: ${d.get('tvl') or 0:,.0f}\n"
+            f"- 价格: ${d.get('price_usd') or 0:,.2f}\n"
+            f"- 24h涨跌: {d.get('change_24h') or 0:+.2f}%"
+            for i, d in enumerate(data, 1)
+        )
+        return "\n".join((*header, *body))
+
+    def generate_html_report(self, data):
+        """生成HTML报告"""
+        rows = "\n".join(
+            f"<tr><td>{d.get('name', 'Unknown')}</td>"
+            f"<td>${d.get('tvl') or 0:,.0f}</td>"
+            f"<td>${d.get('price_usd') or 0:,.2f}</td>"
+            f"<td>{d.get('change_24h') or 0:+.2f}%</td></tr>"
+            for d in data
+        )
+        return f"""<!DOCTYPE html>
+<html lang="zh">
+<head>
+<meta charset="utf-8">
+<title>DeFi Monitor 报告</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 8px 12px; text-align: right; }}
+th {{ background: #1A1A2E; color: white; }}
+td:first-child {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>DeFi协议监控报告</h1>
+<p>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+<table>
+<tr><th>协议</th><th>TVL</th><th>价格</th><th>24h涨跌</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def main():
+    """命令行入口: 拉取数据并生成图表报告"""
+    from data_fetcher import DataFetcher
+    from monitor import PROTOCOLS
+
+    fetcher = DataFetcher()
+    try:
+        fields = fetcher.fetch_all_protocols_soa(PROTOCOLS.values())
+    finally:
+        fetcher.close()
+    Visualizer().generate_report(fields)
+
+
+if __name__ == "__main__":
+    main()
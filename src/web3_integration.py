@@ -0,0 +1,651 @@
+"""
+Web3链上数据集成模块
+
+直连以太坊RPC节点读取链上数据: ETH余额、区块高度、Gas价格、
+ERC-20代币余额和任意合约只读调用:
+    python3 src/web3_integration.py
+
+默认使用LlamaNodes公共节点, 可通过config["rpc_url"]替换。
+"""
+
+import functools
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import orjson
+import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import Web3
+from web3.exceptions import ContractLogicError, TimeExhausted
+
+# 错误路径走lazy %格式化: 级别被屏蔽时连字符串都不拼,
+# 节点故障风暴下也不会在stdout锁上挤作一团;
+# 没有包级__init__, NullHandler挂在模块logger上兜底
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_RPC_URL = "https://eth.llamarpc.com"
+
+# 单位换算常量: from_wei每次都查单位表并构造Decimal,
+# 实际只用到这两个单位, 直接用预计算除数
+WEI_PER_ETHER = 10 ** 18
+WEI_PER_GWEI = 10 ** 9
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(addr):
+    """EIP-55校验和地址 (memo化)
+
+    to_checksum_address每次都要对40字符hex跑一遍keccak256;
+    监控固定地址集时同一地址被反复转换, memo后只算一次。
+    """
+    return Web3.to_checksum_address(addr)
+
+
+def as_ether(wei):
+    """wei -> ether浮点数 (展示层调用一次)
+
+    余额在内部一律以原生int wei流转: 不丢精度,
+    也省掉from_wei每次的Decimal构造。
+    """
+    return wei / WEI_PER_ETHER if wei is not None else None
+
+
+def as_units(raw, decimals=18):
+    """原始uint256余额 -> 按代币decimals换算的浮点数"""
+    return raw / 10 ** decimals if raw is not None else None
+
+# 最小ERC-20 ABI: 只声明监控用到的只读方法。
+# 不可变tuple, 模块加载时分配一次; 配合合约对象缓存,
+# ABI解析和选择器keccak每个代币只发生一次
+ERC20_ABI = (
+    {
+        "constant": True,
+        "inputs": [{"name": "_owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "type": "function",
+    },
+)
+
+# balanceOf(address)的4字节选择器固定不变, 直接写成常量
+BALANCEOF_SELECTOR = b"\x70\xa0\x82\x31"
+
+
+def _balance_of_calldata(wallet_checksum):
+    """手工拼balanceOf calldata: 选择器 + 12字节零填充 + 20字节地址
+
+    单个地址参数的编码就是左补零, 一次bytes拼接即可,
+    跳过Contract -> function -> encode_abi整条Python栈。
+    """
+    return "0x" + (BALANCEOF_SELECTOR + bytes(12)
+                   + bytes.fromhex(wallet_checksum[2:])).hex()
+
+
+# 协议链上合约信息: 地址字面量已是EIP-55校验和形式, 模块加载时
+# 冻结; 查询只是一次字典命中, 不再每次重建dict和重算keccak
+PROTOCOL_INFO = MappingProxyType({
+    "aave": MappingProxyType({
+        "name": "Aave V3",
+        "token": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
+        "pool": "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2",
+    }),
+    "lido": MappingProxyType({
+        "name": "Lido",
+        "token": "0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32",
+        "steth": "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84",
+    }),
+    "eigenlayer": MappingProxyType({
+        "name": "EigenLayer",
+        "token": "0xec53bF9167f50cDEB3Ae105f56099aaaB9061F83",
+        "strategy_manager": "0x858646372CC42E1A627fcE94aa7A7033e7CF075A",
+    }),
+})
+
+# Multicall3: 几乎所有EVM链上同地址部署的只读调用聚合合约
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [{
+    "inputs": [{
+        "components": [
+            {"name": "target", "type": "address"},
+            {"name": "allowFailure", "type": "bool"},
+            {"name": "callData", "type": "bytes"},
+        ],
+        "name": "calls",
+        "type": "tuple[]",
+    }],
+    "name": "aggregate3",
+    "outputs": [{
+        "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"},
+        ],
+        "name": "returnData",
+        "type": "tuple[]",
+    }],
+    "stateMutability": "payable",
+    "type": "function",
+}]
+
+
+class Web3Manager:
+    """以太坊链上数据读取器"""
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.rpc_url = config.get("rpc_url", DEFAULT_RPC_URL)
+        self.timeout = config.get("timeout", 30)
+        # 长连接会话: keep-alive池跨RPC复用TCP+TLS, 公共节点上
+        # 每次冷连接握手要1-2个RTT, 远超调用本身;
+        # 传输层Retry只兜底连接类故障
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=16, pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2)))
+        self.w3 = Web3(Web3.HTTPProvider(
+            self.rpc_url, session=self._session,
+            request_kwargs={"timeout": self.timeout}))
+        self._rpc_id = itertools.count(1)
+
+        # 活性探测按TTL刷新: 一次性connected标志会把"初始化时
+        # 节点抖动"放大成"之后永远返回None"
+        self.live_ttl = config.get("live_ttl", 5.0)
+        self._live = False
+        self._last_live_check = float("-inf")
+
+        # TTL读缓存: 区块号/Gas价格按出块节奏给短TTL,
+        # 命中直接省一次完整HTTPS往返
+        self.block_ttl = config.get("block_ttl", 2.0)
+        self.gas_ttl = config.get("gas_ttl", 1.0)
+        # 所有缓存都用LRU定界: 长驻监控扫过大量地址时
+        # 内存占用保持平坦, 容量可按场景调参。
+        # cachetools的LRUCache不是线程安全的 (连get都会改LRU顺序),
+        # 线程池fanout下并发淘汰会炸KeyError, 共享缓存读写统一加锁
+        self._cache_lock = threading.Lock()
+        self._cache = LRUCache(
+            maxsize=config.get("meta_cache_size", 256))  # (方法名,...) -> (时刻, 值)
+
+        # 区块号钉扎缓存: 余额/合约读数只在新块落地时才变,
+        # 以(键, 区块号)判新鲜 —— 同一块内命中率~100%, 零过期风险,
+        # 也不像墙钟TTL那样在块间隔里白发请求
+        self._block_cache = LRUCache(
+            maxsize=config.get("balance_cache_size", 10000))  # key -> (区块号, 值)
+
+        # JSON-RPC batch: 过大的batch部分节点会拒绝或限流,
+        # 按batch_size分块, 每块一次HTTP POST
+        self.batch_size = config.get("batch_size", 50)
+
+        # Multicall3合约对象按需构造一次
+        self._mc = None
+
+        # 合约对象构造要解析ABI并算函数选择器, 同一代币只做一次;
+        # decimals是常量, 链上查一次后不再发RPC
+        contract_cache_size = config.get("contract_cache_size", 1024)
+        self._contract_cache = LRUCache(maxsize=contract_cache_size)  # 地址 -> Contract
+        self._decimals_cache = LRUCache(maxsize=contract_cache_size)  # 地址 -> int
+
+        # 任意ABI合约的方法工厂缓存: 重复调用同一(地址, 方法)时
+        # 跳过合约构造和ContractFunctions代理的getattr查找
+        self._abi_contracts = LRUCache(maxsize=contract_cache_size)
+        self._fn_cache = LRUCache(maxsize=4 * contract_cache_size)
+
+        # 常驻线程池: requests在I/O等待期释放GIL, 线程fanout对
+        # 延迟受限的RPC有近线性加速, 且不要求节点支持batch;
+        # 所有线程共享同一个keep-alive连接池
+        self._pool = ThreadPoolExecutor(max_workers=config.get("rpc_workers", 16))
+
+        # bulk策略: 有的节点把batch里每个子请求按独立RPC计费/限流,
+        # batch可能反而比并发慢; auto模式下用小探针实测取最快,
+        # 并按probe_ttl复测以跟上节点行为变化
+        self.bulk_strategy = config.get("bulk_strategy", "auto")
+        self.probe_ttl = config.get("probe_ttl", 600.0)
+        self._probed_strategy = None
+        self._last_probe = float("-inf")
+
+        # 预热: 一次轻量探活顺便完成DNS+TCP+TLS握手,
+        # 首个真实查询直接走热连接
+        self._ensure_connected()
+        logger.info("Web3连接%s: %s",
+                    "成功" if self._live else "失败", self.rpc_url)
+
+    def close(self):
+        """关闭线程池和HTTP会话"""
+        self._pool.shutdown(wait=False)
+        self._session.close()
+
+    def _ensure_connected(self):
+        """带TTL缓存的节点活性探测, 节点恢复后自动回到正常路径"""
+        now = time.monotonic()
+        if now - self._last_live_check < self.live_ttl:
+            return self._live
+        try:
+            self._raw_call("eth_blockNumber", [])
+            self._live = True
+        except Exception as e:
+            logger.warning("RPC节点探活失败: %s", e)
+            self._live = False
+        self._last_live_check = now
+        return self._live
+
+    @property
+    def connected(self):
+        """当前连接状态 (探测结果在live_ttl内复用)"""
+        return self._ensure_connected()
+
+    def _raw_call(self, method, params):
+        """原生JSON-RPC POST, 绕过web3中间件栈
+
+        eth_getBalance这类结果只需int(result, 16)的简单调用,
+        走中间件洋葱和AttributeDict包装纯属浪费;
+        直接复用keep-alive会话POST, 单次调用的Python开销约减半。
+        """
+        response = self._session.post(
+            self.rpc_url,
+            data=orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": next(self._rpc_id),
+                "method": method,
+                "params": params,
+            }),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        error = payload.get("error")
+        if error:
+            # 节点返回的语义错误不属于瞬态故障, 不进重试路径
+            raise ValueError(f"RPC错误: {method} - {error}")
+        return payload["result"]
+
+    def _with_retry(self, fn, retries=3, base=0.1):
+        """有界重试 + 指数退避 + 抖动
+
+        只重试瞬态故障 (连接/超时类): 节点抖动时在已有连接上
+        原地重试, 比调用方拿到None后从头重来便宜得多。
+        合约revert (ContractLogicError) 重试无意义, 原样抛出。
+        """
+        for attempt in range(retries):
+            try:
+                return fn()
+            except ContractLogicError:
+                raise
+            except (requests.exceptions.RequestException, TimeExhausted):
+                if attempt == retries - 1:
+                    raise
+                time.sleep(base * 2 ** attempt + random.random() * base)
+
+    def _cached(self, key, ttl, fn):
+        """TTL内返回缓存值, 过期则调用fn并回填"""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = fn()
+        if value is not None:
+            with self._cache_lock:
+                self._cache[key] = (now, value)
+        return value
+
+    def _block_cached(self, key, fn):
+        """以最新区块号为版本的读缓存
+
+        区块号本身走短TTL缓存懒刷新; 拿不到区块号时直接穿透。
+        """
+        block = self.get_block_number()
+        if block is None:
+            return fn()
+        with self._cache_lock:
+            entry = self._block_cache.get(key)
+        if entry is not None and entry[0] == block:
+            return entry[1]
+        value = fn()
+        if value is not None:
+            with self._cache_lock:
+                self._block_cache[key] = (block, value)
+        return value
+
+    def get_eth_balance(self, address):
+        """获取地址的ETH余额 (原生int, 单位: wei; 展示用as_ether)"""
+        if not self.connected:
+            return None
+
+        def fetch():
+            try:
+                checksum = _checksum(address)
+                return int(self._with_retry(lambda: self._raw_call(
+                    "eth_getBalance", [checksum, "latest"])), 16)
+            except Exception as e:
+                logger.warning("获取ETH余额失败: %s", e)
+                return None
+
+        return self._block_cached(("eth_balance", address.lower()), fetch)
+
+    def get_block_number(self):
+        """获取最新区块高度"""
+        if not self.connected:
+            return None
+
+        def fetch():
+            try:
+                return int(self._with_retry(
+                    lambda: self._raw_call("eth_blockNumber", [])), 16)
+            except Exception as e:
+                logger.warning("获取区块高度失败: %s", e)
+                return None
+
+        return self._cached(("block_number",), self.block_ttl, fetch)
+
+    def get_gas_price(self):
+        """获取当前Gas价格 (单位: gwei)"""
+        if not self.connected:
+            return None
+
+        def fetch():
+            try:
+                return int(self._with_retry(
+                    lambda: self._raw_call("eth_gasPrice", [])), 16) / WEI_PER_GWEI
+            except Exception as e:
+                logger.warning("获取Gas价格失败: %s", e)
+                return None
+
+        return self._cached(("gas_price",), self.gas_ttl, fetch)
+
+    def _erc20(self, token_address):
+        """取ERC-20合约对象 (按校验和地址缓存)"""
+        address = _checksum(token_address)
+        with self._cache_lock:
+            contract = self._contract_cache.get(address)
+        if contract is None:
+            contract = self.w3.eth.contract(address=address, abi=ERC20_ABI)
+            with self._cache_lock:
+                self._contract_cache[address] = contract
+        return contract
+
+    def _token_decimals(self, contract):
+        """取代币小数位 (链上只查一次, 查不到按18处理)"""
+        with self._cache_lock:
+            decimals = self._decimals_cache.get(contract.address)
+        if decimals is None:
+            try:
+                decimals = contract.functions.decimals().call()
+            except Exception as e:
+                logger.warning("获取decimals失败, 按18处理: %s", e)
+                decimals = 18
+            with self._cache_lock:
+                self._decimals_cache[contract.address] = decimals
+        return decimals
+
+    def token_decimals(self, token_address):
+        """获取代币小数位 (缓存), 配合as_units在展示层换算"""
+        return self._token_decimals(self._erc20(token_address))
+
+    def get_token_balance(self, token_address, wallet_address):
+        """获取钱包的ERC-20代币余额 (原始uint256; 展示用as_units)"""
+        if not self.connected:
+            return None
+
+        def fetch():
+            try:
+                token = _checksum(token_address)
+                data = _balance_of_calldata(_checksum(wallet_address))
+                result = self._with_retry(lambda: self._raw_call(
+                    "eth_call", [{"to": token, "data": data}, "latest"]))
+                return int(result, 16) if result not in (None, "0x") else 0
+            except Exception as e:
+                logger.warning("获取代币余额失败: %s", e)
+                return None
+
+        return self._block_cached(
+            ("token_balance", token_address.lower(), wallet_address.lower()),
+            fetch)
+
+    def _run_batch(self, items_chunk, build_request, fallback_one):
+        """执行一个batch分块, 节点拒绝batch时回退为线程并发单请求
+
+        build_request: 逐项构造可batch.add的请求/合约函数, 必须在
+            batch上下文内调用 —— web3只在batching激活期间把
+            w3.eth.*调用登记为batch条目, 在上下文外构造会退化成
+            逐个立即执行的串行RPC (batch_requests需要web3>=7)
+        fallback_one: 回退路径下逐项执行的函数
+        """
+        try:
+            with self.w3.batch_requests() as batch:
+                for item in items_chunk:
+                    batch.add(build_request(item))
+                return batch.execute()
+        except Exception as e:
+            logger.warning("batch请求失败, 回退为并发单请求: %s", e)
+            with ThreadPoolExecutor(max_workers=min(16, len(items_chunk))) as pool:
+                return list(pool.map(fallback_one, items_chunk))
+
+    def batch_eth_balances(self, addresses):
+        """批量获取多个地址的ETH余额 (wei; 每batch_size个地址一次POST)
+
+        N个地址的往返次数从N降到ceil(N/batch_size);
+        每项失败时对应位置返回None。
+        """
+        if not self.connected or not addresses:
+            return [None] * len(addresses)
+
+        checksums = [_checksum(a) for a in addresses]
+        results = []
+        for start in range(0, len(checksums), self.batch_size):
+            chunk = checksums[start:start + self.batch_size]
+            raw = self._run_batch(
+                chunk,
+                lambda addr: self.w3.eth.get_balance(addr),
+                lambda addr: self.w3.eth.get_balance(addr),
+            )
+            results.extend(raw)
+        return results
+
+    def batch_token_balances(self, token_address, wallet_addresses):
+        """批量获取同一代币下多个钱包的余额 (原始uint256; batch POST)"""
+        if not self.connected or not wallet_addresses:
+            return [None] * len(wallet_addresses)
+
+        contract = self._erc20(token_address)
+        checksums = [_checksum(w) for w in wallet_addresses]
+
+        results = []
+        for start in range(0, len(checksums), self.batch_size):
+            chunk = checksums[start:start + self.batch_size]
+            results.extend(self._run_batch(
+                chunk,
+                lambda wallet: contract.functions.balanceOf(wallet),
+                lambda wallet: contract.functions.balanceOf(wallet).call(),
+            ))
+        return results
+
+    def _multicall(self):
+        if self._mc is None:
+            self._mc = self.w3.eth.contract(
+                address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        return self._mc
+
+    def aggregate(self, calls):
+        """把多个合约只读调用聚合为一次Multicall3调用
+
+        calls: ContractFunction列表; 返回与输入等长的结果列表。
+        N个eth_call压成一次aggregate3, 网络上只有一个请求,
+        节点侧也只起一个EVM上下文; 单项失败对应位置返回None。
+        """
+        if not self.connected or not calls:
+            return [None] * len(calls)
+
+        try:
+            payload = [
+                (fn.address, True, fn._encode_transaction_data())
+                for fn in calls
+            ]
+            raw = self._multicall().functions.aggregate3(payload).call()
+        except Exception as e:
+            logger.warning("multicall失败: %s", e)
+            return [None] * len(calls)
+
+        results = []
+        for fn, (success, return_data) in zip(calls, raw):
+            if not success or not return_data:
+                results.append(None)
+                continue
+            output_types = [o["type"] for o in fn.abi.get("outputs", [])]
+            decoded = self.w3.codec.decode(output_types, return_data)
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+        return results
+
+    def multicall_token_balances(self, token_address, holder_addresses):
+        """获取同一代币下多个钱包的余额 (原始uint256; 单次Multicall3调用)"""
+        if not self.connected or not holder_addresses:
+            return [None] * len(holder_addresses)
+
+        contract = self._erc20(token_address)
+        return self.aggregate([
+            contract.functions.balanceOf(_checksum(holder))
+            for holder in holder_addresses
+        ])
+
+    def _probe_bulk_strategy(self):
+        """实测各bulk策略在当前节点上的耗时, 返回最快的
+
+        用一组真实balanceOf读数做探针; 探测失败的策略直接出局,
+        全部失败时退回线程并发 (不依赖节点任何扩展能力)。
+        """
+        token = PROTOCOL_INFO["aave"]["token"]
+        holders = [
+            MULTICALL3_ADDRESS,
+            PROTOCOL_INFO["aave"]["pool"],
+            PROTOCOL_INFO["lido"]["token"],
+            PROTOCOL_INFO["lido"]["steth"],
+            PROTOCOL_INFO["eigenlayer"]["strategy_manager"],
+        ]
+        timings = {}
+        for name, runner in (
+            ("multicall", self.multicall_token_balances),
+            ("batch", self.batch_token_balances),
+            ("concurrent", self.map_token_balances),
+        ):
+            started = time.perf_counter()
+            try:
+                runner(token, holders)
+            except Exception as e:
+                logger.warning("bulk策略%s探测失败: %s", name, e)
+                continue
+            timings[name] = time.perf_counter() - started
+
+        if not timings:
+            return "concurrent"
+        best = min(timings, key=timings.get)
+        logger.info("bulk策略探测结果: %s (%s)", best,
+                    ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in timings.items()))
+        return best
+
+    def _bulk_strategy_now(self):
+        """当前应使用的bulk策略 (auto模式下按probe_ttl复测)"""
+        if self.bulk_strategy != "auto":
+            return self.bulk_strategy
+        now = time.monotonic()
+        if (self._probed_strategy is None
+                or now - self._last_probe >= self.probe_ttl):
+            self._probed_strategy = self._probe_bulk_strategy()
+            self._last_probe = now
+        return self._probed_strategy
+
+    def get_token_balances(self, token_address, holder_addresses):
+        """获取同一代币下多个钱包的余额 (原始uint256; 按策略路由)"""
+        strategy = self._bulk_strategy_now()
+        if strategy == "batch":
+            return self.batch_token_balances(token_address, holder_addresses)
+        if strategy == "concurrent":
+            return self.map_token_balances(token_address, holder_addresses)
+        return self.multicall_token_balances(token_address, holder_addresses)
+
+    def get_eth_balances(self, addresses):
+        """获取多个地址的ETH余额 (wei; 按策略路由)
+
+        multicall不覆盖原生ETH余额查询, 该策略下走线程fanout。
+        """
+        strategy = self._bulk_strategy_now()
+        if strategy == "batch":
+            return self.batch_eth_balances(addresses)
+        return list(self._pool.map(self.get_eth_balance, addresses))
+
+    def map_token_balances(self, token_address, wallet_addresses):
+        """并发获取同一代币下多个钱包的余额 (原始uint256; 线程fanout)"""
+        return list(self._pool.map(
+            lambda wallet: self.get_token_balance(token_address, wallet),
+            wallet_addresses))
+
+    def call_contract_method(self, contract_address, abi, method, *args):
+        """调用任意合约的只读方法 (结果按区块号缓存)"""
+        if not self.connected:
+            return None
+
+        def fetch():
+            try:
+                address = _checksum(contract_address)
+                fn_key = (address, method, id(abi))
+                with self._cache_lock:
+                    factory = self._fn_cache.get(fn_key)
+                if factory is None:
+                    contract_key = (address, id(abi))
+                    with self._cache_lock:
+                        contract = self._abi_contracts.get(contract_key)
+                    if contract is None:
+                        contract = self.w3.eth.contract(address=address, abi=abi)
+                        with self._cache_lock:
+                            self._abi_contracts[contract_key] = contract
+                    # 下标访问返回可复用的方法工厂
+                    factory = contract.functions[method]
+                    with self._cache_lock:
+                        self._fn_cache[fn_key] = factory
+                bound = factory(*args)
+                # 显式钉在latest, 与区块号缓存键的语义对齐
+                return self._with_retry(
+                    lambda: bound.call(block_identifier="latest"))
+            except ContractLogicError:
+                # revert属于合约语义错误, 交给调用方处理
+                raise
+            except Exception as e:
+                logger.warning("合约调用失败: %s - %s", method, e)
+                return None
+
+        try:
+            key = ("contract_call", contract_address.lower(), method, args)
+            hash(key)
+        except TypeError:
+            # 参数不可哈希时不缓存, 直接穿透
+            return fetch()
+        return self._block_cached(key, fetch)
+
+    def get_protocol_info(self, protocol_name):
+        """获取协议的链上合约信息"""
+        info = PROTOCOL_INFO.get(protocol_name)
+        return dict(info) if info else None
+
+
+def main():
+    """命令行入口: 打印当前链上基础指标"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    manager = Web3Manager()
+    print(f"📊 最新区块: {manager.get_block_number()}")
+    print(f"⛽ Gas价格: {manager.get_gas_price()} gwei")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Web3链上数据集成模块 (异步)
+
+AsyncWeb3版本的Web3Manager: 批量查询用asyncio.gather把所有RPC
+往返重叠起来, 延迟受限的场景下吞吐随并发度近似线性提升,
+直到节点的RPS上限。底层AsyncHTTPProvider复用同一个aiohttp会话,
+TCP/TLS连接跨调用保持。
+"""
+
+import asyncio
+import logging
+import time
+
+from cachetools import LRUCache
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from web3_integration import (DEFAULT_RPC_URL, ERC20_ABI, WEI_PER_GWEI,
+                              _checksum)
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncWeb3Manager:
+    """以太坊链上数据读取器 (异步)"""
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.rpc_url = config.get("rpc_url", DEFAULT_RPC_URL)
+        self.timeout = config.get("timeout", 30)
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(
+            self.rpc_url, request_kwargs={"timeout": self.timeout}))
+
+        # 信号量限制在飞RPC数: 并发收益在节点RPS上限附近见顶,
+        # 再往上只会换来429
+        self._sem = asyncio.Semaphore(config.get("max_concurrency", 32))
+
+        # TTL读缓存, 分级与同步版一致
+        self.balance_ttl = config.get("balance_ttl", 0.5)
+        self.block_ttl = config.get("block_ttl", 2.0)
+        self.gas_ttl = config.get("gas_ttl", 1.0)
+        # LRU定界, 扫大量地址时内存保持平坦
+        self._cache = LRUCache(
+            maxsize=config.get("balance_cache_size", 10000))  # key -> (时刻, 值)
+
+        # 合约对象与decimals缓存, 语义与同步版一致
+        contract_cache_size = config.get("contract_cache_size", 1024)
+        self._contract_cache = LRUCache(maxsize=contract_cache_size)
+        self._decimals_cache = LRUCache(maxsize=contract_cache_size)
+
+    async def aclose(self):
+        """关闭底层HTTP会话"""
+        disconnect = getattr(self.w3.provider, "disconnect", None)
+        if disconnect is not None:
+            await disconnect()
+
+    async def _cached(self, key, ttl, fetch):
+        """TTL内返回缓存值, 过期则await fetch并回填"""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = await fetch()
+        if value is not None:
+            self._cache[key] = (now, value)
+        return value
+
+    async def get_eth_balance(self, address):
+        """获取地址的ETH余额 (原生int, 单位: wei; 展示用as_ether)"""
+
+        async def fetch():
+            try:
+                async with self._sem:
+                    return await self.w3.eth.get_balance(_checksum(address))
+            except Exception as e:
+                logger.warning("获取ETH余额失败: %s", e)
+                return None
+
+        return await self._cached(("eth_balance", address.lower()),
+                                  self.balance_ttl, fetch)
+
+    async def get_block_number(self):
+        """获取最新区块高度"""
+
+        async def fetch():
+            try:
+                async with self._sem:
+                    return await self.w3.eth.block_number
+            except Exception as e:
+                logger.warning("获取区块高度失败: %s", e)
+                return None
+
+        return await self._cached(("block_number",), self.block_ttl, fetch)
+
+    async def get_gas_price(self):
+        """获取当前Gas价格 (单位: gwei)"""
+
+        async def fetch():
+            try:
+                async with self._sem:
+                    gas_price_wei = await self.w3.eth.gas_price
+                return gas_price_wei / WEI_PER_GWEI
+            except Exception as e:
+                logger.warning("获取Gas价格失败: %s", e)
+                return None
+
+        return await self._cached(("gas_price",), self.gas_ttl, fetch)
+
+    def _erc20(self, token_address):
+        """取ERC-20合约对象 (按校验和地址缓存)"""
+        address = _checksum(token_address)
+        contract = self._contract_cache.get(address)
+        if contract is None:
+            contract = self._contract_cache[address] = self.w3.eth.contract(
+                address=address, abi=ERC20_ABI)
+        return contract
+
+    async def _token_decimals(self, contract):
+        """取代币小数位 (链上只查一次, 查不到按18处理)"""
+        decimals = self._decimals_cache.get(contract.address)
+        if decimals is None:
+            try:
+                async with self._sem:
+                    decimals = await contract.functions.decimals().call()
+            except Exception as e:
+                logger.warning("获取decimals失败, 按18处理: %s", e)
+                decimals = 18
+            self._decimals_cache[contract.address] = decimals
+        return decimals
+
+    async def get_token_balance(self, token_address, wallet_address):
+        """获取钱包的ERC-20代币余额 (原始uint256; 展示用as_units)"""
+
+        async def fetch():
+            try:
+                contract = self._erc20(token_address)
+                async with self._sem:
+                    return await contract.functions.balanceOf(
+                        _checksum(wallet_address)).call()
+            except Exception as e:
+                logger.warning("获取代币余额失败: %s", e)
+                return None
+
+        return await self._cached(
+            ("token_balance", token_address.lower(), wallet_address.lower()),
+            self.balance_ttl, fetch)
+
+    async def get_eth_balances(self, addresses):
+        """并发获取多个地址的ETH余额
+
+        所有往返经gather重叠, 信号量控制在飞数;
+        总耗时趋近最慢一次往返而不是各次之和。
+        """
+        return list(await asyncio.gather(
+            *[self.get_eth_balance(a) for a in addresses]))
+
+    async def get_token_balances(self, token_address, holder_addresses):
+        """并发获取同一代币下多个钱包的余额"""
+        return list(await asyncio.gather(
+            *[self.get_token_balance(token_address, h)
+              for h in holder_addresses]))
+
+
+def main():
+    """命令行入口: 打印当前链上基础指标"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    async def run():
+        manager = AsyncWeb3Manager()
+        try:
+            block, gas = await asyncio.gather(
+                manager.get_block_number(), manager.get_gas_price())
+        finally:
+            await manager.aclose()
+        print(f"📊 最新区块: {block}")
+        print(f"⛽ Gas价格: {gas} gwei")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()